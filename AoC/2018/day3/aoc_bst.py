@@ -3,6 +3,10 @@
 # a Binary Search Tree is a structure where the key in the left child is less the the key in the node
 # and the key in the right child is bigger than the key in the node
 
+# every node also keeps aggregates of the subtree rooted at it - the number of nodes and the sum of
+# their data - so order statistics (rank, select) and prefix sums of the data take O(height) time
+# (O(log n) while the tree is balanced) rather than a full traversal
+
 
 class Node(object):
     def __init__(self, k, d):
@@ -10,7 +14,20 @@ class Node(object):
         self.data = d       # the data is separate from the key and can be used as rank in some algorithms
         self.left = None
         self.right = None
-        
+        self.size = 1       # number of nodes in the subtree rooted at this node
+        self.data_sum = d   # sum of the data of the nodes in the subtree rooted at this node
+
+    def update(self):
+        """ recalculate the subtree aggregates from the children, after any change below this node """
+        self.size = 1
+        self.data_sum = self.data
+        if self.left:
+            self.size += self.left.size
+            self.data_sum += self.left.data_sum
+        if self.right:
+            self.size += self.right.size
+            self.data_sum += self.right.data_sum
+
     def find(self, k):
         """ returns the node with given key or None if not found """
         if self.key == k:
@@ -34,6 +51,44 @@ class Node(object):
         
         return current
 
+    def rank(self, k):
+        """ returns the number of keys in the tree smaller than k """
+        rank = 0
+        current = self
+        while current is not None:
+            if k <= current.key:
+                current = current.left
+            else:
+                rank += 1 + (current.left.size if current.left else 0)
+                current = current.right
+        return rank
+
+    def select(self, i):
+        """ returns the node with the i-th smallest key (starting from 0) or None if i is out of range """
+        current = self
+        while current is not None:
+            left_size = current.left.size if current.left else 0
+            if i < left_size:
+                current = current.left
+            elif i == left_size:
+                return current
+            else:
+                i -= left_size + 1
+                current = current.right
+        return None
+
+    def prefix_sum(self, k):
+        """ returns the sum of the data of all the nodes with keys smaller than or equal to k """
+        total = 0
+        current = self
+        while current is not None:
+            if k < current.key:
+                current = current.left
+            else:
+                total += current.data + (current.left.data_sum if current.left else 0)
+                current = current.right
+        return total
+
     def preorder(self, l):
         """ populate the list l with the (key,data) of a pre-order traversal output of the tree """
         l.append((self.key, self.data))
@@ -78,7 +133,8 @@ def insert(node, key, data):
         node.left = insert(node.left, key, data)
     else:
         node.right = insert(node.right, key, data)
-        
+
+    node.update()
     return node
 
 
@@ -112,7 +168,8 @@ def delete_node(root, key):
         
         # Delete the inorder successor
         root.right = delete_node(root.right, temp.key)
-    
+
+    root.update()
     return root
 
 
@@ -134,6 +191,31 @@ class BST(object):
     
     def find(self, key) -> Node:
         return self.root.find(key)
+
+    def __len__(self):
+        """ the number of nodes in the tree """
+        return self.root.size if self.root else 0
+
+    def rank(self, key):
+        """ return the number of keys in the tree smaller than key """
+        if self.root:
+            return self.root.rank(key)
+        else:
+            return 0
+
+    def select(self, i) -> Node:
+        """ return the node with the i-th smallest key (starting from 0) """
+        node = self.root.select(i) if self.root and i >= 0 else None
+        if node is None:
+            raise IndexError(f"select index {i} out of range for a tree of {len(self)} nodes")
+        return node
+
+    def prefix_sum(self, key):
+        """ return the sum of the data of all the nodes with keys smaller than or equal to key """
+        if self.root:
+            return self.root.prefix_sum(key)
+        else:
+            return 0
         
         
     def remove(self, key):
@@ -0,0 +1,83 @@
+"""
+startup benchmark for the day 3 engines
+
+measures a cold start - a fresh interpreter importing the engines module and solving
+a small claims file - which is what dominates short command line runs.
+every engine is timed over a few runs and the best (least noisy) time is reported
+next to the time of a bare interpreter start.
+
+usage:
+    python bench_startup.py [--claims N] [--runs N] [--max-ms MS] [engine ...]
+
+with --max-ms the script exits with status 1 if any engine's cold start (above the bare
+interpreter start) is slower than MS milliseconds, so it can be used to catch regressions.
+
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from day_three_engines import ENGINES
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def write_small_claims_file(claims_n: int) -> str:
+    """ write the first claims_n claims of claims.txt to a temporary file and return its name """
+    with open(os.path.join(HERE, 'claims.txt'), 'r') as claims_file:
+        lines = [line for _, line in zip(range(claims_n), claims_file)]
+
+    fd, filename = tempfile.mkstemp(suffix='.txt', prefix='claims_')
+    with os.fdopen(fd, 'w') as small_file:
+        small_file.writelines(lines)
+    return filename
+
+
+def cold_run_time(code: str, runs: int) -> float:
+    """ best wall time (seconds) of running code in a fresh interpreter """
+    best = float('inf')
+    for _ in range(runs):
+        start_time = time.perf_counter()
+        subprocess.run([sys.executable, '-c', code], cwd=HERE, check=True, stdout=subprocess.DEVNULL)
+        best = min(best, time.perf_counter() - start_time)
+    return best
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="measure cold import + small solve time of the day 3 engines")
+    parser.add_argument('engines', nargs='*', default=list(ENGINES), help="engines to measure (default: all)")
+    parser.add_argument('--claims', type=int, default=50, help="number of claims in the small claims file")
+    parser.add_argument('--runs', type=int, default=5, help="runs per engine, the best one is reported")
+    parser.add_argument('--max-ms', type=float, default=None, help="fail if an engine exceeds this startup time")
+    args = parser.parse_args(argv)
+
+    small_claims_filename = write_small_claims_file(args.claims)
+    try:
+        baseline = cold_run_time('pass', args.runs)
+        print(f"{'interpreter':12} {baseline * 1000:8.1f} ms")
+
+        failed = False
+        for engine in args.engines:
+            code = f"import day_three_engines; day_three_engines.solve({small_claims_filename!r}, {engine!r})"
+            try:
+                startup = cold_run_time(code, args.runs) - baseline
+            except subprocess.CalledProcessError:
+                print(f"{engine:12} {'failed':>8}")
+                failed = True
+                continue
+
+            over_budget = args.max_ms is not None and startup * 1000 > args.max_ms
+            failed = failed or over_budget
+            print(f"{engine:12} {startup * 1000:8.1f} ms{'  (over budget)' if over_budget else ''}")
+    finally:
+        os.remove(small_claims_filename)
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
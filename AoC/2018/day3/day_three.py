@@ -32,9 +32,9 @@ better (not best) solution:
 2. for each claim
     - identify the square inches of that claim on the map
     - increment the counter in those square inches.
-3. for each claimed square inch in the map
-    if it counts more than one claim add it to total
-4. output total.
+    - when a counter reaches 2 (the square inch is now claimed
+      by more than one claim) add it to total
+3. output total.
 
 
 
@@ -49,8 +49,18 @@ an intersection is detected. until one is left in the set.
 a better solution is to go over the claims file one more time
 and find the one claim that doesn't intersect with any other.
 
+when only part 2 is asked for, the first idea is the one used - it needs a single pass
+over the claims file: the map keeps the ID of the only claim on each square inch
+(or marks it as claimed by many), and the IDs of intersecting claims leave the set.
+
 """
 import re
+from day_three_progress import Progress
+
+# compiled once at import rather than on every Claim construction
+CLAIM_SEPARATORS = re.compile("[ #@,:x]")
+
+MULTI_CLAIMED = -1   # marks a square inch claimed by more than one claim in a map of claim ids
 
 
 class Claim:
@@ -61,7 +71,7 @@ class Claim:
             '#10 @ 936,278: 13x27'
           =  id    left,top  COLSxROWs
         """
-        claim_tokens = filter(None, re.split("[ #@,:x]", claim_str))  # filter = (item for item in iterable if item)
+        claim_tokens = filter(None, CLAIM_SEPARATORS.split(claim_str))  # filter = (item for item in iterable if item)
         self.claim_id, self.left_margin, self.top_margin, self.columns_n, self.rows_n = map(int, claim_tokens)
         
 
@@ -86,26 +96,45 @@ class Claims:
         return Claim(line)
     
 
-def naive_puzzle_solution(filename: str) -> (int, int):
+def naive_puzzle_solution(filename: str, part: int = None, stop_above_area: int = None,
+                          progress_callback=None) -> (int, int):
     """
     parse claims file and return the intersecting area (in square inches)
     returns:
       total_intersecting_area, id_of_the_one_patch_without_intersection
+
+    part - solve only part 1 or part 2 (the answer of the other part is None), default: both
+           part 2 alone reads the claims file once and doesn't count the area
+    stop_above_area - stop as soon as the intersecting area is larger than this and return
+                      (the area found so far, None) - enough to tell the area exceeds the threshold
+                      (a part 1 threshold, it can't be combined with part=2)
+    progress_callback - called with a ProgressReport while claims are marked and checked
     
     >>> naive_puzzle_solution("claims.txt")
     (115304, 275)
+    >>> naive_puzzle_solution("claims.txt", part=1)
+    (115304, None)
+    >>> naive_puzzle_solution("claims.txt", part=2)
+    (None, 275)
+    >>> naive_puzzle_solution("claims.txt", stop_above_area=1000)[0] > 1000
+    True
     
     """
     
-    def mark_claim_on_map(c: Claim, fm: dict):
+    def mark_claim_on_map(c: Claim, fm: dict) -> int:
+        """ returns the number of square inches that became claimed by more than one claim """
+        new_intersections = 0
         for column in range(c.columns_n):
             for row in range(c.rows_n):
                 try:
                     dict_key = (c.left_margin + column, c.top_margin + row)
                     fm[dict_key] = fm.get(dict_key, int()) + 1
+                    if fm[dict_key] == 2:
+                        new_intersections += 1
                 except IndexError as err:
                     print("error: ", err)
                     print(f"row:{c.left_margin + column} column:{c.top_margin + row}")
+        return new_intersections
                     
     def claim_itersects(c: Claim, fm: dict) -> bool:
         """ function checks if claim c intesects with any other claim in the map ..
@@ -121,26 +150,63 @@ def naive_puzzle_solution(filename: str) -> (int, int):
         # if we reached here
         # then all the claim's squares are marked with 1
         # (only one claim was made)
-                
+
+    def mark_claim_id_on_map(c: Claim, fm: dict, clean_ids: dict):
+        """ mark the id of claim c on its square inches and drop intersecting claims from clean_ids """
+        clean_ids[c.claim_id] = True
+        for column in range(c.columns_n):
+            for row in range(c.rows_n):
+                dict_key = (c.left_margin + column, c.top_margin + row)
+                other_id = fm.get(dict_key)
+                if other_id is None:
+                    fm[dict_key] = c.claim_id
+                else:
+                    clean_ids.pop(c.claim_id, None)
+                    clean_ids.pop(other_id, None)
+                    fm[dict_key] = MULTI_CLAIMED
+
+    if part not in (None, 1, 2):
+        raise ValueError(f"part must be 1, 2 or None (both), not {part!r}")
+    if part == 2 and stop_above_area is not None:
+        raise ValueError("stop_above_area is a part 1 threshold and can't be combined with part=2")
+
+    if part == 2:
+        id_map = {}      # square inch -> id of the only claim on it, or MULTI_CLAIMED
+        clean_ids = {}   # ids of the claims not intersecting so far, in file order
+        marking = Progress(progress_callback, 'claims marked')
+        with Claims(filename) as claims:
+            for claim in claims:
+                mark_claim_id_on_map(claim, id_map, clean_ids)
+                marking.advance()
+        marking.finish()
+        return None, next(iter(clean_ids), None)
+
     fabric_map = {}  # a map of the square inches laid claim to on the fabric
 
+    # count intersecting square inch blocks while marking, so the threshold is noticed as soon as it is crossed
+    intersection_area = 0
+    marking = Progress(progress_callback, 'claims marked')
     with Claims(filename) as claims:
         for claim in claims:
-            mark_claim_on_map(claim, fabric_map)
+            intersection_area += mark_claim_on_map(claim, fabric_map)
+            marking.advance()
+            if stop_above_area is not None and intersection_area > stop_above_area:
+                return intersection_area, None
+    marking.finish()
 
-    # count intersecting square inch blocks:
-    intersection_area = 0
-    for (_row, _column), square_inch_occupancy_num in fabric_map.items():
-        if square_inch_occupancy_num > 1:
-            intersection_area += 1
+    if part == 1:
+        return intersection_area, None
 
     # find the only patch that doesn't intersect other patches
+    checking = Progress(progress_callback, 'claims checked', total=marking.done)
     with Claims(filename) as claims:
         for claim in claims:
             if not claim_itersects(claim, fabric_map):
+                checking.finish()
                 return intersection_area, claim.claim_id   # there is only one claim that doesn't intersect.
+            checking.advance()
 
-    return None, None   # should never get here.
+    return intersection_area, None   # should never get here - every claim intersects another.
 
 
 def run_doctests():
@@ -28,6 +28,9 @@ import re
 import heapq
 import time
 import aoc_bst
+from day_three_progress import Progress
+
+CLAIM_SEPARATORS = re.compile("[ #@,:x]")
 
 
 class Claim:
@@ -38,7 +41,7 @@ class Claim:
             '#10 @ 936,278: 13x27'
           =  id    left,top  COLSxROWs
         """
-        claim_tokens = filter(None, re.split("[ #@,:x]", claim_str))  # filter = (item for item in iterable if item)
+        claim_tokens = filter(None, CLAIM_SEPARATORS.split(claim_str))  # filter = (item for item in iterable if item)
         self.claim_id, self.left_margin, self.top_margin, self.columns_n, self.rows_n = map(int, claim_tokens)
         
     # while the top-left square of the canvas is in (0,0) -
@@ -93,12 +96,13 @@ ADD_POINT = 1
 REMOVE_POINT = -1
 
 
-def read_claims_into_pq(filename: str):
+def read_claims_into_pq(filename: str, progress_callback=None):
     """ read all the claims into a priority queue (key = X coord of endpoints)
         the queue stores tuples of the form:
         (X coord, start or end of rectangle, (top y coord, bottom y coord))
     """
     squares_endpoints = []
+    parsing = Progress(progress_callback, 'claims parsed')
     
     with Claims(filename) as claims:
         for claim in claims:
@@ -115,7 +119,9 @@ def read_claims_into_pq(filename: str):
 
             # note the end-segment-signal (value = -1) is placed on the next cell after the last cell
             # hence the +1
+            parsing.advance()
 
+    parsing.finish()
     return squares_endpoints
 
 
@@ -174,19 +180,29 @@ def next_x_on_heap(h):
     return h[0][0]  # the minimum X is always in index 0 in the heap
 
 
-def bst_ospf_puzzle_solution(filename: str) -> int:
+def bst_ospf_puzzle_solution(filename: str, stop_above_area: int = None, progress_callback=None) -> int:
     """
     parse claims file and return the intersecting area (in square inches)
     returns: total_intersecting_area
 
+    stop_above_area - stop the scan as soon as the intersecting area is larger than this and return
+                      the area found so far - enough to tell the area exceeds the threshold
+    progress_callback - called with a ProgressReport while claims are parsed and while edges
+                        are swept (the fraction of the sweep is the fraction of the X axis scanned)
+
     """
     multi_rect_covered_area = 0
 
     # read and parse the input file, adding the
     # rectangles right and left edges to a priority queue
-    rectangles_edges_heap = read_claims_into_pq(filename)
+    rectangles_edges_heap = read_claims_into_pq(filename, progress_callback)
 
     start_time = time.time()
+
+    sweeping = Progress(progress_callback, 'events swept', total=len(rectangles_edges_heap))
+    if rectangles_edges_heap:
+        first_x = next_x_on_heap(rectangles_edges_heap)
+        x_axis_length = max(edge[0] for edge in rectangles_edges_heap) - first_x
     
     # for every X coordinate having edges in the queue create a BST of
     # horizontal segments along that column defined by that X coordinate
@@ -198,10 +214,13 @@ def bst_ospf_puzzle_solution(filename: str) -> int:
         last_x = next_x_on_heap(rectangles_edges_heap)
         
         # construct segment tree from all the segments of current x in the scan
+        events_n = 0
         for edge_points in all_segments_of_x(last_x, rectangles_edges_heap):
             _, add_or_remove, y_coords = edge_points
             y_top, y_bottom = y_coords
             process_rectangle_edge(column_segments_bst, add_or_remove, y_top, y_bottom)
+            events_n += 1
+        sweeping.advance(events_n, (last_x - first_x) / x_axis_length if x_axis_length else 1.0)
             
         # calculate the area covered by multiple claims in this vertical segment
         ordered_list_of_segments = column_segments_bst.inorder()
@@ -216,6 +235,12 @@ def bst_ospf_puzzle_solution(filename: str) -> int:
         # add the total area covered by multiple claims in this tree to total
         multi_rect_covered_area += col_num * area
 
+        # the area only grows as the scan moves right, so once above the threshold it stays above it
+        if stop_above_area is not None and multi_rect_covered_area > stop_above_area:
+            break
+    else:
+        sweeping.finish()
+
     end_time = time.time()
     print(f"The algorithm took {end_time - start_time} seconds to complete")
     
@@ -0,0 +1,67 @@
+"""
+Advent of code 2018 - python coding contest
+challenge for day 3 - https://adventofcode.com/2018/day/3
+
+a single entry point for all the solutions (engines) of the day 3 challenge.
+
+the engines are registered by the module and function names only and are imported
+the first time they are picked, so a short run pays only for the engine it uses
+(ie. numpy is loaded only when the np engine is picked).
+the options each engine takes are listed next to it, so they are checked without importing it.
+
+the sharded engine reads the claims from shard files (see day_three_ingest) - for it the
+claims file may be a glob pattern or a list of shard files and glob patterns.
+
+usage:
+    python day_three_engines.py [engine] [claims file]
+    python day_three_engines.py sharded 'shards/*.txt.gz' [more shards ...]
+
+"""
+
+import importlib
+import sys
+
+# engine name -> (module, solution function, options the solution function takes)
+ENGINES = {
+    'naive': ('day_three', 'naive_puzzle_solution', {'part', 'stop_above_area', 'progress_callback'}),
+    'bst': ('day_three_bst', 'bst_ospf_puzzle_solution', {'stop_above_area', 'progress_callback'}),
+    'np': ('day_three_np', 'np_puzzle_solution', set()),
+    'runs': ('day_three_runs', 'runs_puzzle_solution', {'part', 'stop_above_area', 'progress_callback'}),
+    'sharded': ('day_three_ingest', 'sharded_puzzle_solution',
+                {'workers', 'part', 'stop_above_area', 'progress_callback'}),
+}
+
+DEFAULT_ENGINE = 'runs'
+
+
+def get_engine(name: str):
+    """ import the module of the named engine and return its solution function """
+    try:
+        module_name, function_name, _options = ENGINES[name]
+    except KeyError:
+        raise ValueError(f"unknown engine {name!r}, pick one of: {', '.join(ENGINES)}") from None
+    return getattr(importlib.import_module(module_name), function_name)
+
+
+def supports_options(name: str, options) -> bool:
+    """ returns True if the named engine accepts all the options """
+    return ENGINES[name][2].issuperset(options)
+
+
+def solve(filename: str, engine: str = DEFAULT_ENGINE, **options):
+    """ solve the claims file with the named engine, passing on engine specific options
+        (ie. part, stop_above_area, progress_callback, workers)
+    """
+    if engine in ENGINES and not supports_options(engine, options):
+        supporting = [name for name in ENGINES if supports_options(name, options)]
+        raise ValueError(f"engine {engine!r} doesn't support the options {', '.join(options)}, "
+                         f"engines that do: {', '.join(supporting) or 'none'}")
+    return get_engine(engine)(filename, **options)
+
+
+if __name__ == "__main__":
+    engine_name = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_ENGINE
+    claims_filename = sys.argv[2] if len(sys.argv) > 2 else 'claims.txt'
+    if len(sys.argv) > 3:
+        claims_filename = sys.argv[2:]   # many shards
+    print(solve(claims_filename, engine_name))
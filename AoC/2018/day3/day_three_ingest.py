@@ -0,0 +1,171 @@
+"""
+Advent of code 2018 - python coding contest
+challenge for day 3 - https://adventofcode.com/2018/day/3
+
+reading claims delivered as many shard files (plain text or gzip compressed)
+
+rather than creating a Claim object per line, every shard is parsed in one go into
+columns - typed arrays holding the ids, margins and sizes of all the claims in that shard.
+the claims are matched one at a time and their numbers go straight into the arrays, so
+nothing per claim is kept beyond the arrays (only the short lived regex match of the line).
+the shards are parsed in parallel by a pool of processes (one per core by default)
+and their columns are concatenated in shard order, so the claims keep their original order.
+
+the columns feed directly into runs_columns_solution() of the runs engine.
+sharded_puzzle_solution() is registered as the 'sharded' engine of day_three_engines.solve().
+
+usage:
+    python day_three_ingest.py 'shards/*.txt.gz' [more shards ...]
+
+"""
+
+import glob
+import gzip
+import re
+import sys
+from array import array
+
+from day_three_progress import Progress
+from day_three_runs import runs_columns_solution
+
+# a whole line holding a single claim - '#10 @ 936,278: 13x27' = id left,top COLSxROWS
+CLAIM_LINE = re.compile(rb"^[ \t]*#[ \t]*(\d+)[ \t]*@[ \t]*(\d+),(\d+):[ \t]*(\d+)x(\d+)[ \t\r]*$", re.MULTILINE)
+NON_BLANK_LINE = re.compile(rb"^[ \t\r]*\S", re.MULTILINE)
+GZIP_MAGIC = b"\x1f\x8b"
+
+
+class ClaimColumns:
+    """ the claims as columns - one typed array per claim field """
+
+    TYPECODE = 'q'   # signed 64 bit
+
+    def __init__(self):
+        self.claim_ids = array(self.TYPECODE)
+        self.left_margins = array(self.TYPECODE)
+        self.top_margins = array(self.TYPECODE)
+        self.columns_ns = array(self.TYPECODE)
+        self.rows_ns = array(self.TYPECODE)
+
+    def columns(self) -> tuple:
+        """ the columns in the order of the fields in the claim string """
+        return self.claim_ids, self.left_margins, self.top_margins, self.columns_ns, self.rows_ns
+
+    def extend(self, other):
+        """ append the claims of other after the claims in self """
+        for column, other_column in zip(self.columns(), other.columns()):
+            column.extend(other_column)
+
+    def __len__(self):
+        return len(self.claim_ids)
+
+
+def read_shard_bytes(filename: str) -> bytes:
+    """ return the content of a shard, decompressing it if it is gzip compressed """
+    with open(filename, 'rb') as shard:
+        data = shard.read()
+    if data[:2] == GZIP_MAGIC:
+        data = gzip.decompress(data)
+    return data
+
+
+def parse_shard(filename: str) -> ClaimColumns:
+    """ parse all the claims in a single shard into columns, one claim per non blank line """
+    data = read_shard_bytes(filename)
+
+    shard_columns = ClaimColumns()
+    add_claim_id = shard_columns.claim_ids.append
+    add_left_margin = shard_columns.left_margins.append
+    add_top_margin = shard_columns.top_margins.append
+    add_columns_n = shard_columns.columns_ns.append
+    add_rows_n = shard_columns.rows_ns.append
+    for claim in CLAIM_LINE.finditer(data):
+        add_claim_id(int(claim[1]))
+        add_left_margin(int(claim[2]))
+        add_top_margin(int(claim[3]))
+        add_columns_n(int(claim[4]))
+        add_rows_n(int(claim[5]))
+
+    if len(shard_columns) != sum(1 for _ in NON_BLANK_LINE.finditer(data)):
+        raise ValueError(f"{filename}: malformed claim in line {first_malformed_line(data)}")
+    return shard_columns
+
+
+def first_malformed_line(data: bytes) -> int:
+    """ the number (starting from 1) of the first non blank line of data that isn't a claim """
+    for line_n, line in enumerate(data.splitlines(), 1):
+        if line.strip() and not CLAIM_LINE.match(line):
+            return line_n
+    return None
+
+
+def shard_filenames(shards) -> list:
+    """ expand a glob pattern or a list of filenames and glob patterns into a list of shard filenames """
+    if isinstance(shards, str):
+        shards = [shards]
+
+    filenames = []
+    for pattern in shards:
+        matches = sorted(glob.glob(pattern))
+        if not matches:
+            raise FileNotFoundError(f"no claims shard matches {pattern!r}")
+        filenames.extend(matches)
+    return filenames
+
+
+def read_shards(shards, workers: int = None, progress_callback=None) -> ClaimColumns:
+    """ parse the claims of all the shards in parallel and concatenate them in shard order
+        workers is the number of processes (default: one per core)
+        progress_callback is called with a ProgressReport as each shard is added
+        (counting claims, the fraction done is the fraction of the shards added)
+    """
+    filenames = shard_filenames(shards)
+
+    all_columns = ClaimColumns()
+    parsing = Progress(progress_callback, 'claims parsed', every=1)
+
+    def add_shard(shard_n, shard_columns):
+        all_columns.extend(shard_columns)
+        parsing.advance(len(shard_columns), (shard_n + 1) / len(filenames))
+
+    if len(filenames) == 1 or workers == 1:
+        # no need to pay for starting a pool of processes
+        for shard_n, filename in enumerate(filenames):
+            add_shard(shard_n, parse_shard(filename))
+    else:
+        from concurrent.futures import ProcessPoolExecutor   # only a run with many shards pays for the pool import
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for shard_n, shard_columns in enumerate(pool.map(parse_shard, filenames)):
+                add_shard(shard_n, shard_columns)
+
+    parsing.finish()
+    return all_columns
+
+
+def sharded_puzzle_solution(shards, workers: int = None, part: int = None, stop_above_area: int = None,
+                            progress_callback=None) -> (int, int):
+    """
+    read the claims from the shards and return the intersecting area (in square inches)
+    returns:
+      total_intersecting_area, id_of_the_one_patch_without_intersection
+
+    the options are those of runs_columns_solution(), the progress_callback is also
+    called while the shards are parsed
+
+    >>> sharded_puzzle_solution("claims.txt")
+    (115304, 275)
+
+    """
+    columns = read_shards(shards, workers, progress_callback).columns()
+    return runs_columns_solution(*columns, part, stop_above_area, progress_callback)
+
+
+def run_doctests():
+    import doctest
+    doctest.testmod()
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        print(sharded_puzzle_solution(sys.argv[1:]))
+    else:
+        run_doctests()
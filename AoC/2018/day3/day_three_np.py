@@ -1,8 +1,9 @@
 import re
-import itertools
-import numpy as np
 import time
 
+CLAIM_SEPARATORS = re.compile("[ #@,:x]")
+
+
 class Claim:
     """ Parse a claim string """
     
@@ -11,7 +12,7 @@ class Claim:
             '#10 @ 936,278: 13x27'
           =  id    left,top  COLSxROWs
         """
-        claim_tokens = filter(None, re.split("[ #@,:x]", claim_str))  # filter = (item for item in iterable if item)
+        claim_tokens = filter(None, CLAIM_SEPARATORS.split(claim_str))  # filter = (item for item in iterable if item)
         self.claim_id, self.left_margin, self.top_margin, self.columns_n, self.rows_n = map(int, claim_tokens)
 
 
@@ -40,11 +41,14 @@ def np_puzzle_solution(filename: str) -> int:
     """
     parse claims file and return the intersecting area (in square inches)
 
-    >>> naive_puzzle_solution("claims.txt")
+    >>> np_puzzle_solution("claims.txt")  # doctest: +ELLIPSIS
+    The algorithm took ... seconds to complete
     115304
 
     """
     
+    import numpy as np   # imported here so loading this module (or picking another engine) doesn't pay for numpy
+
     # read the file into memory:
     with Claims(filename) as claims:
         claims_list = [c for c in claims]
@@ -54,16 +58,17 @@ def np_puzzle_solution(filename: str) -> int:
     def mark_claim_on_map(c, fm):
         fm[c.left_margin:c.left_margin + c.columns_n, c.top_margin:c.top_margin + c.rows_n] += 1
     
+    # the fabric is at least 1000 inches on each side, but claims may reach beyond that
+    # (slicing past the edge of the map would silently drop the overflowing square inches)
     FABRIC_SIZE = 1050  # a little larger than 1000
-    fabric_map = np.zeros((FABRIC_SIZE, FABRIC_SIZE))
+    fabric_columns = max([FABRIC_SIZE] + [c.left_margin + c.columns_n for c in claims_list])
+    fabric_rows = max([FABRIC_SIZE] + [c.top_margin + c.rows_n for c in claims_list])
+    fabric_map = np.zeros((fabric_columns, fabric_rows))
     
     for claim in claims_list:
         mark_claim_on_map(claim, fabric_map)
     
-    intersection_area = 0
-    for square_inch_occupancy_num in itertools.chain.from_iterable(fabric_map):
-        if square_inch_occupancy_num > 1:
-            intersection_area += 1
+    intersection_area = int(np.count_nonzero(fabric_map > 1))
     
     end_time = time.time()
     
@@ -76,6 +81,10 @@ def np_puzzle_solution(filename: str) -> int:
 
 def run_doctests():
     import doctest
+    import importlib.util
+    if importlib.util.find_spec("numpy") is None:
+        print("numpy is not installed - skipping the doctests of the np engine")
+        return
     doctest.testmod()
 
 
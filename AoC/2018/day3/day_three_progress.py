@@ -0,0 +1,79 @@
+"""
+progress reporting for long running solutions of the day 3 challenge
+
+a solution reports the progress of each of its stages (ie. 'claims parsed', 'events swept')
+through a Progress object, which calls a user supplied callback with a ProgressReport
+every few steps and once more when the stage is finished.
+the report holds the throughput (steps per second) and, when the size of the stage or the
+fraction processed is known, an estimate of the time left (ETA).
+
+usage:
+    bst_ospf_puzzle_solution('claims.txt', progress_callback=print_progress)
+
+"""
+
+import sys
+import time
+from collections import namedtuple
+
+# stage - name of the stage, done - steps done so far, total - steps in the stage (None if unknown)
+# fraction - fraction of the stage done (None if unknown), elapsed - seconds since the stage started
+# throughput - steps per second, eta - estimated seconds left (None if unknown)
+ProgressReport = namedtuple('ProgressReport', ['stage', 'done', 'total', 'fraction', 'elapsed', 'throughput', 'eta'])
+
+
+class Progress:
+    """ track the progress of a single stage of a solution and report it to a callback """
+
+    def __init__(self, callback, stage: str, total: int = None, every: int = 1000):
+        """ callback is called with a ProgressReport every `every` steps (no reports if callback is None) """
+        self.callback = callback
+        self.stage = stage
+        self.total = total
+        self.every = every
+        self.done = 0
+        self.fraction = None   # set by stages that measure their progress by other means than steps
+        self.next_report = every
+        self.start_time = time.perf_counter()
+
+    def advance(self, steps: int = 1, fraction: float = None):
+        """ count steps done, optionally updating the fraction of the stage done """
+        self.done += steps
+        if fraction is not None:
+            self.fraction = fraction
+        if self.callback is not None and self.done >= self.next_report:
+            self.next_report = self.done + self.every
+            self.callback(self.report())
+
+    def finish(self):
+        """ mark the stage as done and send a final report """
+        self.fraction = 1.0
+        if self.callback is not None:
+            self.callback(self.report())
+
+    def report(self) -> ProgressReport:
+        elapsed = time.perf_counter() - self.start_time
+        throughput = self.done / elapsed if elapsed > 0 else 0.0
+
+        fraction = self.fraction
+        if fraction is None and self.total:
+            fraction = self.done / self.total
+
+        eta = None
+        if fraction is not None and fraction > 0:
+            eta = elapsed * (1 - fraction) / fraction
+
+        return ProgressReport(self.stage, self.done, self.total, fraction, elapsed, throughput, eta)
+
+
+def print_progress(report: ProgressReport):
+    """ a progress callback writing a single line per report to stderr """
+    line = f"{report.stage}: {report.done}"
+    if report.total is not None:
+        line += f"/{report.total}"
+    if report.fraction is not None:
+        line += f" ({report.fraction:.1%})"
+    line += f" {report.throughput:.0f}/s"
+    if report.eta is not None:
+        line += f" ETA {report.eta:.1f}s"
+    print(line, file=sys.stderr)
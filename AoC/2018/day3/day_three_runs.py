@@ -0,0 +1,203 @@
+"""
+Advent of code 2018 - python coding contest
+challenge for day 3 - https://adventofcode.com/2018/day/3
+
+solving the same challenge but keeping every row of the fabric as a list of runs
+rather than marking every square inch (dict / dense grid).
+a run is a tuple (start, end, depth) covering the columns start..end-1 of that row
+where depth is the number of claims covering those columns.
+the runs of a row are sorted, never overlap and only cover claimed columns.
+
+
+the solution outline:
+    1. for each claim, and for each row the claim spans
+        - merge the interval [left, left + width) into the runs of that row (interval arithmetic):
+          runs inside the interval get depth + 1, uncovered gaps become new runs of depth 1
+          and runs crossing the interval edges are split at the edges
+        - coalesce adjacent runs with the same depth so the row keeps as few boundaries as possible
+    2. the intersecting area is the total length of the runs that reached depth 2 while merging
+       (the same as the sum of the lengths of all runs with depth > 1 once all claims are merged)
+    3. a claim doesn't intersect any other claim if in each of its rows the interval of the
+       claim lies inside a single run of depth 1
+
+
+
+the cost of merging a claim depends on the number of run boundaries in the rows it spans
+and not on the number of square inches it covers - which pays off for wide but sparse claims.
+
+"""
+
+import bisect
+from day_three import Claims
+from day_three_progress import Progress
+
+
+def add_interval(runs: list, start: int, end: int) -> int:
+    """ merge the interval [start, end) into the sorted runs of a single row,
+        raising the depth of every column in the interval by one (in place)
+        returns the number of columns that became covered by more than one claim
+    """
+    # first run that ends after the interval starts
+    i = bisect.bisect_left(runs, (start,))
+    if i and runs[i - 1][1] > start:
+        i -= 1
+
+    merged = []       # the runs replacing runs[i:j]
+    cursor = start    # the columns of the interval before cursor are already merged
+    new_multi_claimed = 0
+    j = i
+    while j < len(runs) and runs[j][0] < end:
+        run_start, run_end, depth = runs[j]
+        if run_start < cursor:
+            merged.append((run_start, cursor, depth))   # the part of the run left of the interval
+        elif run_start > cursor:
+            merged.append((cursor, run_start, 1))       # an unclaimed gap inside the interval
+        segment_end = min(run_end, end)
+        merged.append((max(run_start, cursor), segment_end, depth + 1))
+        if depth == 1:
+            new_multi_claimed += segment_end - max(run_start, cursor)
+        if run_end > end:
+            merged.append((end, run_end, depth))        # the part of the run right of the interval
+        cursor = segment_end
+        j += 1
+
+    if cursor < end:
+        merged.append((cursor, end, 1))
+
+    # coalesce the merged runs along with their neighbours on both sides
+    lo = max(i - 1, 0)
+    hi = min(j + 1, len(runs))
+    runs[lo:hi] = coalesce_runs(runs[lo:i] + merged + runs[j:hi])
+    return new_multi_claimed
+
+
+def coalesce_runs(runs: list) -> list:
+    """ join adjacent runs (touching with the same depth) into a single run """
+    coalesced = []
+    for run in runs:
+        if coalesced and coalesced[-1][1] == run[0] and coalesced[-1][2] == run[2]:
+            coalesced[-1] = (coalesced[-1][0], run[1], run[2])
+        else:
+            coalesced.append(run)
+    return coalesced
+
+
+def multi_claim_length(runs: list) -> int:
+    """ the number of columns in a row that are covered by more than one claim """
+    return sum(run_end - run_start for run_start, run_end, depth in runs if depth > 1)
+
+
+def interval_is_single_claimed(runs: list, start: int, end: int) -> bool:
+    """ returns True if all the columns in [start, end) are covered by exactly one claim """
+    i = bisect.bisect_right(runs, (start, float('inf'))) - 1
+    if i < 0:
+        return False   # never marked
+    run_start, run_end, depth = runs[i]
+    return depth == 1 and run_start <= start and end <= run_end
+
+
+def mark_claim_on_rows(left: int, top: int, columns_n: int, rows_n: int, fabric_rows: dict) -> int:
+    """ merge a claim rectangle into the runs of all the rows it spans
+        returns the number of square inches that became claimed by more than one claim
+    """
+    new_multi_claimed = 0
+    for row in range(top, top + rows_n):
+        new_multi_claimed += add_interval(fabric_rows.setdefault(row, []), left, left + columns_n)
+    return new_multi_claimed
+
+
+def claim_intersects(left: int, top: int, columns_n: int, rows_n: int, fabric_rows: dict) -> bool:
+    """ returns True if a claim rectangle intersects with other claims on the fabric rows """
+    for row in range(top, top + rows_n):
+        if not interval_is_single_claimed(fabric_rows.get(row, []), left, left + columns_n):
+            return True
+    return False
+
+
+def runs_columns_solution(claim_ids, left_margins, top_margins, columns_ns, rows_ns, part: int = None,
+                          stop_above_area: int = None, progress_callback=None) -> (int, int):
+    """
+    solve the claims given as columns (sequences of the same length, one value per claim)
+    returns:
+      total_intersecting_area, id_of_the_one_patch_without_intersection
+
+    part - solve only part 1 or part 2 (the answer of the other part is None), default: both
+    stop_above_area - stop as soon as the intersecting area is larger than this and return
+                      (the area found so far, None) - can't be combined with part=2
+    progress_callback - called with a ProgressReport while claims are merged and checked
+
+    >>> runs_columns_solution([1, 2, 3], [1, 3, 5], [3, 1, 5], [4, 4, 2], [4, 4, 2])
+    (4, 3)
+    >>> runs_columns_solution([1, 2, 3], [1, 3, 5], [3, 1, 5], [4, 4, 2], [4, 4, 2], part=2)
+    (None, 3)
+
+    """
+    if part not in (None, 1, 2):
+        raise ValueError(f"part must be 1, 2 or None (both), not {part!r}")
+    if part == 2 and stop_above_area is not None:
+        raise ValueError("stop_above_area is a part 1 threshold and can't be combined with part=2")
+
+    # count the intersecting area while merging, so the threshold is noticed as soon as it is crossed
+    fabric_rows = {}  # row -> sorted list of (start, end, depth) runs
+    intersection_area = 0
+    merging = Progress(progress_callback, 'claims merged', total=len(claim_ids))
+    for claim in zip(left_margins, top_margins, columns_ns, rows_ns):
+        intersection_area += mark_claim_on_rows(*claim, fabric_rows)
+        merging.advance()
+        if stop_above_area is not None and intersection_area > stop_above_area:
+            return intersection_area, None
+    merging.finish()
+
+    if part == 1:
+        return intersection_area, None
+    if part == 2:
+        intersection_area = None
+
+    # find the only patch that doesn't intersect other patches
+    checking = Progress(progress_callback, 'claims checked', total=len(claim_ids))
+    for claim_id, *claim in zip(claim_ids, left_margins, top_margins, columns_ns, rows_ns):
+        if not claim_intersects(*claim, fabric_rows):
+            checking.finish()
+            return intersection_area, claim_id
+        checking.advance()
+
+    return intersection_area, None   # should never get here - every claim intersects another.
+
+
+def runs_puzzle_solution(filename: str, part: int = None, stop_above_area: int = None,
+                         progress_callback=None) -> (int, int):
+    """
+    parse claims file and return the intersecting area (in square inches)
+    returns:
+      total_intersecting_area, id_of_the_one_patch_without_intersection
+
+    the options are those of runs_columns_solution(), the progress_callback is also
+    called while the claims file is parsed
+
+    >>> runs_puzzle_solution("claims.txt")
+    (115304, 275)
+
+    """
+    claims_list = []
+    parsing = Progress(progress_callback, 'claims parsed')
+    with Claims(filename) as claims:
+        for claim in claims:
+            claims_list.append(claim)
+            parsing.advance()
+    parsing.finish()
+
+    return runs_columns_solution([c.claim_id for c in claims_list],
+                                 [c.left_margin for c in claims_list],
+                                 [c.top_margin for c in claims_list],
+                                 [c.columns_n for c in claims_list],
+                                 [c.rows_n for c in claims_list],
+                                 part, stop_above_area, progress_callback)
+
+
+def run_doctests():
+    import doctest
+    doctest.testmod()
+
+
+if __name__ == "__main__":
+    run_doctests()
@@ -1,3 +1,4 @@
+import random
 import unittest
 from aoc_bst import BST
 
@@ -146,3 +147,66 @@ class TestBST(unittest.TestCase):
         self.bst.remove(3)
         self.assertEqual([(1, 0),(4, 0), (5, 0)], self.bst.inorder())
         self.assertEqual(4, self.bst.root.left.key)
+
+    def test_aggregates(self):
+        """ subtree sizes and data sums are kept through insert, accumulate and remove """
+        for key, data in [(50, 1), (30, 2), (20, 3), (40, 4), (70, 5), (60, 6), (80, 7)]:
+            self.bst.insert(key, data)
+        self.assertEqual(7, len(self.bst))
+        self.assertEqual(28, self.bst.root.data_sum)
+        self.assertEqual(3, self.bst.root.left.size)
+
+        # accumulate into an existing node
+        self.bst.insert(60, 10)
+        self.assertEqual(7, len(self.bst))
+        self.assertEqual(38, self.bst.root.data_sum)
+        self.assertEqual(28, self.bst.root.right.data_sum)
+
+        # remove root node with 2 children
+        self.bst.remove(50)
+        self.assertEqual(6, len(self.bst))
+        self.assertEqual(37, self.bst.root.data_sum)
+        # remove non existent node (no effect)
+        self.bst.remove(55)
+        self.assertEqual(6, len(self.bst))
+
+    def test_rank_select_prefix_sum(self):
+        self.assertEqual(0, len(self.bst))
+        self.assertEqual(0, self.bst.rank(10))
+        self.assertEqual(0, self.bst.prefix_sum(10))
+        self.assertRaises(IndexError, self.bst.select, 0)
+
+        for key, data in [(50, 1), (30, 1), (20, 1), (40, -1), (70, -1), (60, 1), (80, -1)]:
+            self.bst.insert(key, data)
+        self.assertEqual(0, self.bst.rank(20))
+        self.assertEqual(3, self.bst.rank(50))
+        self.assertEqual(4, self.bst.rank(55))
+        self.assertEqual(7, self.bst.rank(100))
+        self.assertEqual(20, self.bst.select(0).key)
+        self.assertEqual(50, self.bst.select(3).key)
+        self.assertEqual(80, self.bst.select(6).key)
+        self.assertRaises(IndexError, self.bst.select, 7)
+        self.assertRaises(IndexError, self.bst.select, -1)
+        self.assertEqual(0, self.bst.prefix_sum(10))
+        self.assertEqual(2, self.bst.prefix_sum(30))
+        self.assertEqual(1, self.bst.prefix_sum(45))
+        self.assertEqual(3, self.bst.prefix_sum(60))
+        self.assertEqual(1, self.bst.prefix_sum(80))
+
+    def test_rank_select_prefix_sum_random(self):
+        """ compare against the in-order traversal while randomly inserting, accumulating and removing keys """
+        rng = random.Random(2018)
+        for _ in range(500):
+            key = rng.randint(0, 50)
+            if rng.random() < 0.3:
+                self.bst.remove(key)
+            else:
+                self.bst.insert(key, rng.randint(-3, 3))
+
+            inorder = self.bst.inorder()
+            self.assertEqual(len(inorder), len(self.bst))
+            probe = rng.randint(-1, 51)
+            self.assertEqual(sum(1 for k, _ in inorder if k < probe), self.bst.rank(probe))
+            self.assertEqual(sum(d for k, d in inorder if k <= probe), self.bst.prefix_sum(probe))
+            for i, (k, _) in enumerate(inorder):
+                self.assertEqual(k, self.bst.select(i).key)
@@ -0,0 +1,44 @@
+import os
+import tempfile
+import unittest
+from day_three import naive_puzzle_solution
+
+
+class TestNaive(unittest.TestCase):
+    def test_naive_puzzle_solution(self):
+        self.assertEqual((115304, 275), naive_puzzle_solution('claims.txt'))
+
+    def test_part(self):
+        self.assertEqual((115304, None), naive_puzzle_solution('claims.txt', part=1))
+        self.assertEqual((None, 275), naive_puzzle_solution('claims.txt', part=2))
+        self.assertRaises(ValueError, naive_puzzle_solution, 'claims.txt', part=3)
+
+    def test_part_2_without_clean_claim(self):
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'claims.txt')
+            with open(filename, 'w') as claims_file:
+                claims_file.write("#1 @ 1,3: 4x4\n#2 @ 3,1: 4x4\n#3 @ 4,4: 2x2\n")
+            self.assertEqual((None, None), naive_puzzle_solution(filename, part=2))
+            self.assertEqual((6, None), naive_puzzle_solution(filename))
+
+    def test_stop_above_area(self):
+        area, claim_id = naive_puzzle_solution('claims.txt', stop_above_area=1000)
+        self.assertGreater(area, 1000)
+        self.assertLess(area, 115304)
+        self.assertIsNone(claim_id)
+        # the threshold is never crossed
+        self.assertEqual((115304, 275), naive_puzzle_solution('claims.txt', stop_above_area=115304))
+        self.assertEqual((115304, None), naive_puzzle_solution('claims.txt', part=1, stop_above_area=115304))
+        self.assertRaises(ValueError, naive_puzzle_solution, 'claims.txt', part=2, stop_above_area=10)
+
+    def test_progress_callback(self):
+        reports = []
+        naive_puzzle_solution('claims.txt', progress_callback=reports.append)
+        marked = [report for report in reports if report.stage == 'claims marked']
+        self.assertEqual(1349, marked[-1].done)
+        checked = [report for report in reports if report.stage == 'claims checked']
+        self.assertEqual((1349, 1.0), (checked[-1].total, checked[-1].fraction))
+
+        reports = []
+        naive_puzzle_solution('claims.txt', part=2, progress_callback=reports.append)
+        self.assertEqual({'claims marked'}, {report.stage for report in reports})
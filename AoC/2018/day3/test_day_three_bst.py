@@ -1,5 +1,7 @@
+import contextlib
+import io
 import unittest
-from day_three_bst import calculate_requested_area_for_bst
+from day_three_bst import calculate_requested_area_for_bst, bst_ospf_puzzle_solution
 
 
 class TestBST(unittest.TestCase):
@@ -14,3 +16,26 @@ class TestBST(unittest.TestCase):
         self.assertEqual(5, calculate_requested_area_for_bst(ordered_list_5_cells))
         self.assertEqual(0, calculate_requested_area_for_bst(ordered_list_0_cells))
         self.assertEqual(5, calculate_requested_area_for_bst(ordered_list_5_cells_2))
+
+    def test_stop_above_area(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertEqual(115304, bst_ospf_puzzle_solution('claims.txt', stop_above_area=115304))
+            area = bst_ospf_puzzle_solution('claims.txt', stop_above_area=1000)
+        self.assertGreater(area, 1000)
+        self.assertLess(area, 115304)
+
+    def test_progress_callback(self):
+        reports = []
+        with contextlib.redirect_stdout(io.StringIO()):
+            bst_ospf_puzzle_solution('claims.txt', progress_callback=reports.append)
+        stages = [report.stage for report in reports]
+        self.assertEqual(['claims parsed', 'events swept'], sorted(set(stages), key=stages.index))
+
+        parsed = [report for report in reports if report.stage == 'claims parsed']
+        self.assertEqual(1349, parsed[-1].done)
+        swept = [report for report in reports if report.stage == 'events swept']
+        self.assertEqual(2 * 1349, swept[-1].done)
+        self.assertEqual(2 * 1349, swept[-1].total)
+        self.assertEqual(1.0, swept[-1].fraction)
+        fractions = [report.fraction for report in swept]
+        self.assertEqual(sorted(fractions), fractions)
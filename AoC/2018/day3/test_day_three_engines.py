@@ -0,0 +1,60 @@
+import inspect
+import os
+import subprocess
+import sys
+import unittest
+from day_three_engines import ENGINES, get_engine, solve
+
+
+class TestEngines(unittest.TestCase):
+    def test_get_engine(self):
+        for name, (_module_name, function_name, options) in ENGINES.items():
+            solution = get_engine(name)
+            self.assertEqual(function_name, solution.__name__)
+            # the options listed for the engine are the ones its solution function takes after the claims file
+            self.assertEqual(options, set(list(inspect.signature(solution).parameters)[1:]))
+        self.assertRaises(ValueError, get_engine, 'no such engine')
+
+    def test_solve(self):
+        self.assertEqual((115304, 275), solve('claims.txt', 'runs'))
+
+    def test_solve_options(self):
+        """ the default engine takes the progress and early exit options """
+        reports = []
+        self.assertEqual((115304, 275), solve('claims.txt', progress_callback=reports.append))
+        self.assertTrue(reports)
+        self.assertGreater(solve('claims.txt', stop_above_area=10)[0], 10)
+        self.assertEqual((None, 275), solve('claims.txt', part=2))
+
+    def test_solve_sharded(self):
+        self.assertEqual((115304, 275), solve('claims.txt', 'sharded'))
+        self.assertEqual((None, 275), solve(['claims.txt'], 'sharded', workers=1, part=2))
+
+    def test_solve_unsupported_options(self):
+        with self.assertRaisesRegex(ValueError, "engines that do: naive, bst, runs, sharded"):
+            solve('claims.txt', 'np', stop_above_area=10)
+        with self.assertRaisesRegex(ValueError, "engines that do: sharded$"):
+            solve('claims.txt', 'runs', workers=2)
+        with self.assertRaisesRegex(ValueError, "engines that do: naive, runs, sharded$"):
+            solve('claims.txt', 'bst', part=2)
+        with self.assertRaisesRegex(ValueError, "engines that do: none"):
+            solve('claims.txt', 'runs', no_such_option=1)
+
+    def test_lazy_imports(self):
+        """ picking any engine (even the np one) must not import numpy before solving """
+        code = ("import sys, day_three_engines; "
+                "[day_three_engines.get_engine(name) for name in day_three_engines.ENGINES]; "
+                "print('numpy' in sys.modules)")
+        output = subprocess.run([sys.executable, '-c', code], cwd=os.path.dirname(os.path.abspath(__file__)),
+                                capture_output=True, text=True, check=True).stdout
+        self.assertEqual('False', output.strip())
+
+    def test_import_time(self):
+        """ importing the engines module must stay cheap - only the modules it needs itself """
+        output = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import day_three_engines'],
+                                cwd=os.path.dirname(os.path.abspath(__file__)),
+                                capture_output=True, text=True, check=True).stderr
+        # lines of the form 'import time:  self [us] | cumulative | name'
+        imported = {line.split('|')[-1].strip() for line in output.splitlines() if line.startswith('import time:')}
+        heavy = {'inspect', 'numpy', 'ast', 'concurrent.futures', 'multiprocessing'}
+        self.assertEqual(set(), imported & heavy)
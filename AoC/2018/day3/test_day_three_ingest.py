@@ -0,0 +1,86 @@
+import gzip
+import os
+import tempfile
+import unittest
+from day_three import Claim
+from day_three_ingest import parse_shard, read_shards, shard_filenames, sharded_puzzle_solution
+
+
+class TestIngest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        with open('claims.txt', 'r') as claims_file:
+            self.lines = claims_file.readlines()
+
+        # split claims.txt into 4 shards, every other shard is gzip compressed
+        shard_size = len(self.lines) // 4 + 1
+        for shard_n in range(4):
+            shard_lines = ''.join(self.lines[shard_n * shard_size:(shard_n + 1) * shard_size]).encode()
+            if shard_n % 2:
+                with gzip.open(self.shard_path(f"claims_{shard_n}.txt.gz"), 'wb') as shard:
+                    shard.write(shard_lines)
+            else:
+                with open(self.shard_path(f"claims_{shard_n}.txt"), 'wb') as shard:
+                    shard.write(shard_lines)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def shard_path(self, name):
+        return os.path.join(self.directory.name, name)
+
+    def test_parse_shard(self):
+        columns = parse_shard(self.shard_path("claims_1.txt.gz"))
+        claim = Claim(self.lines[len(self.lines) // 4 + 1])   # first claim of the second shard
+        self.assertEqual([claim.claim_id, claim.left_margin, claim.top_margin, claim.columns_n, claim.rows_n],
+                         [column[0] for column in columns.columns()])
+
+    def test_parse_malformed_shard(self):
+        with open(self.shard_path("bad.txt"), 'w') as shard:
+            shard.write("#1 @ 3,2: 5x4\n#2 @ 3,2\n")
+        self.assertRaises(ValueError, parse_shard, self.shard_path("bad.txt"))
+
+        # the extra numbers of one line make up for the missing numbers of another line
+        with open(self.shard_path("bad.txt"), 'w') as shard:
+            shard.write("#1 @ 3,2\n#2 @ 1,1: 2x2 7 7\n#3 @ 5,5: 1x1\n")
+        with self.assertRaisesRegex(ValueError, "line 1"):
+            parse_shard(self.shard_path("bad.txt"))
+
+    def test_parse_blank_lines(self):
+        with open(self.shard_path("blank.txt"), 'w') as shard:
+            shard.write("#1 @ 3,2: 5x4\r\n\n  \n#2 @ 1,1: 2x2\r\n")
+        self.assertEqual([1, 2], list(parse_shard(self.shard_path("blank.txt")).claim_ids))
+
+    def test_shard_filenames(self):
+        self.assertEqual(4, len(shard_filenames(self.shard_path("claims_*"))))
+        self.assertEqual([self.shard_path("claims_3.txt.gz"), self.shard_path("claims_0.txt")],
+                         shard_filenames([self.shard_path("claims_3*"), self.shard_path("claims_0.txt")]))
+        self.assertRaises(FileNotFoundError, shard_filenames, self.shard_path("no_such_shard_*"))
+
+    def test_read_shards(self):
+        for workers in (1, 2):
+            columns = read_shards(self.shard_path("claims_*"), workers)
+            self.assertEqual(len(self.lines), len(columns))
+            self.assertEqual(list(range(1, len(self.lines) + 1)), list(columns.claim_ids))
+
+    def test_sharded_puzzle_solution(self):
+        self.assertEqual((115304, 275), sharded_puzzle_solution(self.shard_path("claims_*"), workers=2))
+
+    def test_read_shards_progress(self):
+        for workers in (1, 2):
+            reports = []
+            read_shards(self.shard_path("claims_*"), workers, progress_callback=reports.append)
+            # one report per shard and a final one
+            self.assertEqual([0.25, 0.5, 0.75, 1.0, 1.0], [report.fraction for report in reports])
+            self.assertEqual(len(self.lines), reports[-1].done)
+            self.assertEqual({'claims parsed'}, {report.stage for report in reports})
+
+    def test_sharded_puzzle_solution_options(self):
+        shards = self.shard_path("claims_*")
+        self.assertEqual((115304, None), sharded_puzzle_solution(shards, workers=1, part=1))
+        self.assertEqual((None, 275), sharded_puzzle_solution(shards, workers=1, part=2))
+        self.assertGreater(sharded_puzzle_solution(shards, workers=1, stop_above_area=1000)[0], 1000)
+        reports = []
+        sharded_puzzle_solution(shards, workers=1, progress_callback=reports.append)
+        self.assertEqual(['claims parsed', 'claims merged', 'claims checked'],
+                         list(dict.fromkeys(report.stage for report in reports)))
@@ -0,0 +1,37 @@
+import unittest
+from day_three_progress import Progress, ProgressReport
+
+
+class TestProgress(unittest.TestCase):
+    def setUp(self):
+        self.reports = []
+
+    def test_report_every(self):
+        progress = Progress(self.reports.append, 'steps', total=10, every=4)
+        for _ in range(10):
+            progress.advance()
+        self.assertEqual([4, 8], [report.done for report in self.reports])
+        progress.finish()
+        self.assertEqual(10, self.reports[-1].done)
+        self.assertEqual(1.0, self.reports[-1].fraction)
+        self.assertEqual(0.0, self.reports[-1].eta)
+
+    def test_report(self):
+        progress = Progress(None, 'steps', total=8)
+        progress.advance(2)
+        report = progress.report()
+        self.assertIsInstance(report, ProgressReport)
+        self.assertEqual(('steps', 2, 8, 0.25), report[:4])
+        self.assertGreaterEqual(report.eta, 0.0)
+        self.assertGreater(report.throughput, 0.0)
+
+        # an explicit fraction overrides done / total
+        progress.advance(1, fraction=0.5)
+        self.assertEqual(0.5, progress.report().fraction)
+
+    def test_unknown_total(self):
+        progress = Progress(self.reports.append, 'steps', every=1)
+        progress.advance()
+        self.assertIsNone(self.reports[-1].total)
+        self.assertIsNone(self.reports[-1].fraction)
+        self.assertIsNone(self.reports[-1].eta)
@@ -0,0 +1,76 @@
+import unittest
+from day_three_runs import add_interval, multi_claim_length, interval_is_single_claimed, runs_puzzle_solution
+
+
+class TestRuns(unittest.TestCase):
+    def setUp(self):
+        self.runs = []
+
+    def test_add_interval(self):
+        add_interval(self.runs, 5, 10)
+        self.assertEqual([(5, 10, 1)], self.runs)
+        # disjoint interval on each side
+        add_interval(self.runs, 0, 2)
+        add_interval(self.runs, 12, 15)
+        self.assertEqual([(0, 2, 1), (5, 10, 1), (12, 15, 1)], self.runs)
+        # interval crossing a run edge splits that run
+        add_interval(self.runs, 8, 11)
+        self.assertEqual([(0, 2, 1), (5, 8, 1), (8, 10, 2), (10, 11, 1), (12, 15, 1)], self.runs)
+        # interval covering gaps and several runs
+        add_interval(self.runs, 1, 13)
+        self.assertEqual([(0, 1, 1), (1, 2, 2), (2, 5, 1), (5, 8, 2), (8, 10, 3), (10, 11, 2),
+                          (11, 12, 1), (12, 13, 2), (13, 15, 1)], self.runs)
+
+    def test_add_interval_coalesce(self):
+        # touching intervals of the same depth become a single run
+        add_interval(self.runs, 0, 5)
+        add_interval(self.runs, 5, 10)
+        self.assertEqual([(0, 10, 1)], self.runs)
+        add_interval(self.runs, 0, 5)
+        add_interval(self.runs, 5, 10)
+        self.assertEqual([(0, 10, 2)], self.runs)
+
+    def test_multi_claim_length(self):
+        add_interval(self.runs, 0, 10)
+        self.assertEqual(0, multi_claim_length(self.runs))
+        add_interval(self.runs, 5, 15)
+        self.assertEqual(5, multi_claim_length(self.runs))
+        add_interval(self.runs, 6, 8)
+        self.assertEqual(5, multi_claim_length(self.runs))
+
+    def test_interval_is_single_claimed(self):
+        self.assertFalse(interval_is_single_claimed(self.runs, 0, 5))
+        add_interval(self.runs, 0, 5)
+        add_interval(self.runs, 5, 10)
+        add_interval(self.runs, 8, 12)
+        self.assertTrue(interval_is_single_claimed(self.runs, 0, 5))
+        self.assertTrue(interval_is_single_claimed(self.runs, 2, 8))
+        self.assertFalse(interval_is_single_claimed(self.runs, 5, 10))
+        self.assertFalse(interval_is_single_claimed(self.runs, 10, 14))
+
+    def test_add_interval_new_multi_claimed(self):
+        self.assertEqual(0, add_interval(self.runs, 0, 10))
+        self.assertEqual(5, add_interval(self.runs, 5, 15))
+        # columns already covered by more than one claim aren't counted again
+        self.assertEqual(2, add_interval(self.runs, 8, 12))
+        self.assertEqual(multi_claim_length(self.runs), 5 + 2)
+
+    def test_runs_puzzle_solution_options(self):
+        self.assertEqual((115304, None), runs_puzzle_solution('claims.txt', part=1))
+        self.assertEqual((None, 275), runs_puzzle_solution('claims.txt', part=2))
+        area, claim_id = runs_puzzle_solution('claims.txt', stop_above_area=1000)
+        self.assertGreater(area, 1000)
+        self.assertLess(area, 115304)
+        self.assertIsNone(claim_id)
+        self.assertEqual((115304, 275), runs_puzzle_solution('claims.txt', stop_above_area=115304))
+        self.assertRaises(ValueError, runs_puzzle_solution, 'claims.txt', part=2, stop_above_area=10)
+        self.assertRaises(ValueError, runs_puzzle_solution, 'claims.txt', part=3)
+
+    def test_runs_puzzle_solution_progress(self):
+        reports = []
+        runs_puzzle_solution('claims.txt', progress_callback=reports.append)
+        parsed = [report for report in reports if report.stage == 'claims parsed']
+        self.assertEqual((1349, 1.0), (parsed[-1].done, parsed[-1].fraction))
+        merged = [report for report in reports if report.stage == 'claims merged']
+        self.assertEqual((1349, 1349, 1.0), (merged[-1].done, merged[-1].total, merged[-1].fraction))
+        self.assertTrue(any(report.stage == 'claims checked' for report in reports))
@@ -0,0 +1,293 @@
+"""
+differential testing of all the day 3 engines against naive_puzzle_solution
+
+random claim sets of a few kinds (scattered, edge touching, nested, zero overlap, large coordinates
+and wide sparse claims) are solved by every engine and the answers are compared with the reference.
+engines returning only the area (bst, np) are compared on part 1 only.
+the np engine needs numpy - without it the np engine isn't checked, which is reported as a
+warning and a skipped test (and it is always left out for claim sets too large for a dense grid).
+the sharded ingestion is checked too - the claims are split into plain and gzip shards
+and solved by sharded_puzzle_solution.
+a failing claim set is shrunk (dropping claims, then shrinking margins and sizes) to a minimal
+claim set that still fails before it is reported, along with the seed that generated it.
+
+the claim sets are generated from a fixed seed so every run is deterministic.
+by default a fast smoke suite runs, for a long soak raise the number of cases (and change the seed):
+
+    DAY_THREE_DIFF_CASES=5000 DAY_THREE_DIFF_SEED=7 python -m pytest -q test_differential.py
+
+"""
+
+import contextlib
+import gzip
+import io
+import os
+import random
+import tempfile
+import unittest
+import warnings
+
+from day_three import naive_puzzle_solution
+from day_three_engines import ENGINES, get_engine
+from day_three_ingest import sharded_puzzle_solution
+
+CASES = int(os.environ.get('DAY_THREE_DIFF_CASES', 25))   # cases per kind of claim set
+SEED = int(os.environ.get('DAY_THREE_DIFF_SEED', 2018))
+
+NP_MAX_FABRIC = 4000   # the np engine allocates the whole fabric, skip it for larger claim sets
+NP_MISSING = "numpy is not installed - the np engine is not checked by the differential tests"
+SHARDS = 3             # the claims are split into this many shards, every other shard is gzip compressed
+
+
+def numpy_available() -> bool:
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+# claim set generators - a claim is a tuple (left, top, columns, rows) and gets its id by position
+
+def scattered_claims(rng):
+    return [(rng.randint(0, 40), rng.randint(0, 40), rng.randint(1, 12), rng.randint(1, 12))
+            for _ in range(rng.randint(1, 12))]
+
+
+def edge_touching_claims(rng):
+    """ every claim shares an edge (or a corner) with an earlier claim, but rarely overlaps it """
+    claims = [(rng.randint(0, 20), rng.randint(0, 20), rng.randint(1, 8), rng.randint(1, 8))]
+    for _ in range(rng.randint(0, 10)):
+        left, top, columns, rows = rng.choice(claims)
+        new_columns, new_rows = rng.randint(1, 8), rng.randint(1, 8)
+        side = rng.choice(('left', 'right', 'above', 'below'))
+        if side == 'left':
+            left, top = left - new_columns, top + rng.randint(-new_rows, rows)
+        elif side == 'right':
+            left, top = left + columns, top + rng.randint(-new_rows, rows)
+        elif side == 'above':
+            left, top = left + rng.randint(-new_columns, columns), top - new_rows
+        else:
+            left, top = left + rng.randint(-new_columns, columns), top + rows
+        claims.append((max(left, 0), max(top, 0), new_columns, new_rows))
+    return claims
+
+
+def nested_claims(rng):
+    """ every claim lies inside an earlier claim """
+    claims = [(rng.randint(0, 10), rng.randint(0, 10), rng.randint(1, 30), rng.randint(1, 30))]
+    for _ in range(rng.randint(0, 8)):
+        left, top, columns, rows = rng.choice(claims)
+        new_columns, new_rows = rng.randint(1, columns), rng.randint(1, rows)
+        claims.append((left + rng.randint(0, columns - new_columns), top + rng.randint(0, rows - new_rows),
+                       new_columns, new_rows))
+    rng.shuffle(claims)
+    return claims
+
+
+def zero_overlap_claims(rng):
+    """ claims in separate cells of a lattice, so no two claims overlap """
+    cell = 10
+    cells = rng.sample([(x, y) for x in range(6) for y in range(6)], rng.randint(1, 12))
+    claims = []
+    for x, y in cells:
+        columns, rows = rng.randint(1, cell), rng.randint(1, cell)
+        claims.append((x * cell + rng.randint(0, cell - columns), y * cell + rng.randint(0, cell - rows),
+                       columns, rows))
+    return claims
+
+
+def large_coordinates_claims(rng):
+    """ claims far from the top left corner of the fabric, clustered so some of them overlap """
+    base_left, base_top = rng.randint(0, 10 ** 6), rng.randint(0, 10 ** 6)
+    return [(base_left + rng.randint(0, 50), base_top + rng.randint(0, 50), rng.randint(1, 20), rng.randint(1, 20))
+            for _ in range(rng.randint(1, 10))]
+
+
+def wide_claims(rng):
+    """ wide but short claims over a sparse fabric """
+    return [(rng.randint(0, 3000), rng.randint(0, 15), rng.randint(1, 2000), rng.randint(1, 3))
+            for _ in range(rng.randint(1, 8))]
+
+
+GENERATORS = {
+    'scattered': scattered_claims,
+    'edge_touching': edge_touching_claims,
+    'nested': nested_claims,
+    'zero_overlap': zero_overlap_claims,
+    'large_coordinates': large_coordinates_claims,
+    'wide': wide_claims,
+}
+
+
+def claims_text(claims) -> str:
+    return ''.join(f"#{claim_id} @ {left},{top}: {columns}x{rows}\n"
+                   for claim_id, (left, top, columns, rows) in enumerate(claims, 1))
+
+
+class DifferentialChecker:
+    """ solve claim sets with every engine and describe where they disagree with the reference """
+
+    def __init__(self, directory: str):
+        self.filename = os.path.join(directory, 'claims.txt')
+        self.shards_pattern = os.path.join(directory, 'claims_shard_*')
+        self.has_numpy = numpy_available()
+
+    def write_shards(self, claims):
+        """ split the claims in order into SHARDS shards (some of them may be empty) """
+        lines = claims_text(claims).splitlines(keepends=True)
+        shard_size = len(lines) // SHARDS + 1
+        for shard_n in range(SHARDS):
+            shard_lines = ''.join(lines[shard_n * shard_size:(shard_n + 1) * shard_size]).encode()
+            shard_filename = self.shards_pattern.replace('*', str(shard_n))
+            with (gzip.open if shard_n % 2 else open)(shard_filename, 'wb') as shard:
+                shard.write(shard_lines)
+
+    def engines_for(self, claims):
+        fabric_size = max(max(left + columns, top + rows) for left, top, columns, rows in claims)
+        for name in ENGINES:
+            if name == 'naive':
+                continue
+            if name == 'np' and (not self.has_numpy or fabric_size > NP_MAX_FABRIC):
+                continue
+            yield name
+
+    def mismatches(self, claims) -> list:
+        with open(self.filename, 'w') as claims_file:
+            claims_file.write(claims_text(claims))
+
+        expected = naive_puzzle_solution(self.filename)
+        found = []
+        for name in self.engines_for(claims):
+            with contextlib.redirect_stdout(io.StringIO()):   # some engines print their timing
+                answer = get_engine(name)(self.filename)
+            if not isinstance(answer, tuple):
+                answer, expected_answer = (answer,), expected[:1]   # engine solves part 1 only
+            else:
+                expected_answer = expected
+            if answer != expected_answer:
+                found.append(f"{name}: {answer} != naive: {expected_answer}")
+
+        # the single pass part 2 of the reference itself
+        answer = naive_puzzle_solution(self.filename, part=2)
+        if answer != (None, expected[1]):
+            found.append(f"naive part=2: {answer} != naive: {(None, expected[1])}")
+
+        # one process is enough here, the pool itself is covered by test_day_three_ingest
+        self.write_shards(claims)
+        answer = sharded_puzzle_solution(self.shards_pattern, workers=1)
+        if answer != expected:
+            found.append(f"sharded: {answer} != naive: {expected}")
+        return found
+
+    def shrink(self, claims) -> list:
+        """ return a minimal claim set (by greedy reduction) that still fails """
+        claims = list(claims)
+        progress = True
+        while progress:
+            progress = False
+
+            # try dropping claims
+            i = 0
+            while i < len(claims) and len(claims) > 1:
+                candidate = claims[:i] + claims[i + 1:]
+                if self.mismatches(candidate):
+                    claims = candidate
+                    progress = True
+                else:
+                    i += 1
+
+            # try moving all the claims together towards the top left corner
+            for field in range(2):
+                for shift in halving_steps(min(claim[field] for claim in claims)):
+                    candidate = [claim[:field] + (claim[field] - shift,) + claim[field + 1:] for claim in claims]
+                    if self.mismatches(candidate):
+                        claims = candidate
+                        progress = True
+                        break
+
+            # try smaller margins and sizes of each claim
+            for i in range(len(claims)):
+                for field in range(4):
+                    smallest = 0 if field < 2 else 1
+                    for step in halving_steps(claims[i][field] - smallest):
+                        claim = claims[i]
+                        candidate = claims[:i] + [claim[:field] + (claim[field] - step,) + claim[field + 1:]] + claims[i + 1:]
+                        if self.mismatches(candidate):
+                            claims = candidate
+                            progress = True
+                            break
+        return claims
+
+
+def halving_steps(n: int):
+    """ the steps n, n/2, n/4 ... 1 to try when shrinking a value by up to n """
+    while n > 0:
+        yield n
+        n //= 2
+
+
+class TestDifferential(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.checker = DifferentialChecker(cls.directory.name)
+        if not cls.checker.has_numpy:
+            warnings.warn(NP_MISSING)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.directory.cleanup()
+
+    def check_claims(self, claims, description):
+        if self.checker.mismatches(claims):
+            shrunk = self.checker.shrink(claims)
+            self.fail(f"engines disagree on {description}, shrunk to:\n{claims_text(shrunk)}"
+                      + "\n".join(self.checker.mismatches(shrunk)))
+
+    def check_kind(self, kind):
+        for case in range(CASES):
+            rng = random.Random(f"{SEED}-{kind}-{case}")
+            self.check_claims(GENERATORS[kind](rng), f"{kind} case {case} (seed {SEED})")
+
+    def test_scattered(self):
+        self.check_kind('scattered')
+
+    def test_edge_touching(self):
+        self.check_kind('edge_touching')
+
+    def test_nested(self):
+        self.check_kind('nested')
+
+    def test_zero_overlap(self):
+        self.check_kind('zero_overlap')
+
+    def test_large_coordinates(self):
+        self.check_kind('large_coordinates')
+
+    def test_wide(self):
+        self.check_kind('wide')
+
+    def test_fixed_cases(self):
+        self.check_claims([(0, 0, 1, 1)], "a single claim")
+        self.check_claims([(3, 2, 5, 4), (3, 2, 5, 4)], "two identical claims")
+        self.check_claims([(1, 3, 4, 4), (3, 1, 4, 4), (5, 5, 2, 2)], "the example claims")
+
+    @unittest.skipUnless(numpy_available(), NP_MISSING)
+    def test_np_engine(self):
+        """ the np engine is among the engines checked (the other tests check it on every claim set) """
+        self.assertIn('np', list(self.checker.engines_for([(0, 0, 1, 1)])))
+        self.check_claims([(3, 2, 5, 4), (3, 2, 5, 4)], "two identical claims")
+        self.check_claims([(1, 3, 4, 4), (3, 1, 4, 4), (5, 5, 2, 2)], "the example claims")
+
+    def test_shrink(self):
+        """ the shrinker reduces a failing claim set to the claims that fail """
+        checker = DifferentialChecker(self.directory.name)
+        checker.mismatches = lambda claims: ["fails"] if (5, 5, 3, 3) in claims else []
+        self.assertEqual([(5, 5, 3, 3)], checker.shrink([(0, 0, 2, 2), (5, 5, 3, 3), (9, 9, 1, 1)]))
+        checker.mismatches = lambda claims: ["fails"] if any(left >= 7 for left, _, _, _ in claims) else []
+        self.assertEqual([(7, 0, 1, 1)], checker.shrink([(0, 0, 2, 2), (20, 5, 3, 3)]))
+
+
+if __name__ == "__main__":
+    unittest.main()